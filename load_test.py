@@ -0,0 +1,104 @@
+# load_test.py
+"""Load test for the solve service (src/service.py).
+
+Starts the service on a free local port, submits jobs one at a time and
+then all at once from several client threads, and prints throughput and
+latency for both runs.
+
+    python load_test.py --jobs 8 --workers 2 --generations 10
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from urllib.error import HTTPError
+
+from src.service import make_server
+
+
+def request(url, data=None, content_type='text/csv'):
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': content_type})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.read()
+    except HTTPError as e:
+        return e.code, e.read()
+
+
+def solve(base_url, csv_data, generations, population_size):
+    """Submit one job, poll it until done and download the CSV; returns latency"""
+    start = time.time()
+    while True:
+        code, body = request(f"{base_url}/jobs?generations={generations}"
+                             f"&population_size={population_size}", csv_data)
+        if code == 202:
+            break
+        time.sleep(0.2)  # queue full, retry
+    job_id = json.loads(body)['job_id']
+    while True:
+        status = json.loads(request(f"{base_url}/jobs/{job_id}")[1])
+        if status['status'] in ('done', 'failed'):
+            break
+        time.sleep(0.05)
+    code, result = request(f"{base_url}/jobs/{job_id}/result")
+    if code != 200:
+        raise RuntimeError(f"Job {job_id} {status['status']}: {status.get('error')}")
+    return time.time() - start
+
+
+def run_batch(base_url, csv_data, jobs, clients, generations, population_size):
+    latencies = []
+    lock = threading.Lock()
+    remaining = list(range(jobs))
+
+    def client():
+        while True:
+            with lock:
+                if not remaining:
+                    return
+                remaining.pop()
+            latency = solve(base_url, csv_data, generations, population_size)
+            with lock:
+                latencies.append(latency)
+
+    start = time.time()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+    latencies.sort()
+    print(f"{clients:>3} clients: {jobs} jobs in {elapsed:.2f}s, "
+          f"{jobs / elapsed:.2f} jobs/s, latency p50 {latencies[len(latencies) // 2]:.2f}s "
+          f"max {latencies[-1]:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the timetable solve service")
+    parser.add_argument('--csv', default='timetable_data.csv')
+    parser.add_argument('--jobs', type=int, default=8)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--population-size', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.csv, 'rb') as f:
+        csv_data = f.read()
+
+    server, service = make_server(port=0, workers=args.workers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        run_batch(base_url, csv_data, args.jobs, 1, args.generations, args.population_size)
+        run_batch(base_url, csv_data, args.jobs, args.clients, args.generations, args.population_size)
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == '__main__':
+    main()
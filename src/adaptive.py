@@ -0,0 +1,118 @@
+# src/adaptive.py
+import random
+
+CROSSOVER_OPERATORS = ['single_point', 'two_point', 'uniform']
+MUTATION_OPERATORS = ['day', 'time', 'room', 'swap']
+
+
+class AdaptiveOperatorControl:
+    """Pick GA operators by how much fitness they have been producing.
+
+    Each operator keeps a recency-weighted quality estimate. Every offspring
+    gets one crossover strategy and one mutation type, drawn by probability
+    matching over those estimates with a floor so no operator is ever
+    switched off. The crossover strategy is credited with the child's gain
+    over the mean of its parents, the mutation type with the gain of the
+    mutated offspring over that crossover child. Mutation rate follows the median success rule: it
+    grows while more than half the offspring beat the median of the
+    generation they were bred from and shrinks otherwise. The number of
+    changes per gene shrinks as the population converges.
+    """
+
+    def __init__(self, crossover_ops=None, mutation_ops=None,
+                 mutation_rate=0.5, min_mutation_rate=0.05, max_mutation_rate=0.5,
+                 max_mutations=3, learning_rate=0.3, min_probability=0.05):
+        self.crossover_ops = list(crossover_ops or CROSSOVER_OPERATORS)
+        self.mutation_ops = list(mutation_ops or MUTATION_OPERATORS)
+        self.mutation_rate = mutation_rate
+        self.min_mutation_rate = min_mutation_rate
+        self.max_mutation_rate = max_mutation_rate
+        self.max_mutations_limit = max_mutations
+        self.max_mutations = max_mutations
+        self.learning_rate = learning_rate
+        self.min_probability = min_probability
+        self.crossover_quality = {op: 1.0 for op in self.crossover_ops}
+        self.mutation_quality = {op: 1.0 for op in self.mutation_ops}
+        self.pending = []
+        self.previous_median = None
+        self.history = []
+
+    # Probability matching with a minimum share per operator
+    def _probabilities(self, quality):
+        total = sum(quality.values())
+        floor = self.min_probability
+        spare = 1.0 - floor * len(quality)
+        if total <= 0:
+            return {op: 1.0 / len(quality) for op in quality}
+        return {op: floor + spare * q / total for op, q in quality.items()}
+
+    def crossover_probabilities(self):
+        return self._probabilities(self.crossover_quality)
+
+    def mutation_probabilities(self):
+        return self._probabilities(self.mutation_quality)
+
+    def choose_crossover(self):
+        probs = self.crossover_probabilities()
+        return random.choices(list(probs), weights=list(probs.values()))[0]
+
+    def choose_mutation(self):
+        probs = self.mutation_probabilities()
+        return random.choices(list(probs), weights=list(probs.values()))[0]
+
+    # Remember which operators produced an offspring, scored next generation
+    def record(self, offspring_index, parent_fitness, child_fitness, crossover_op, mutation_op):
+        """``parent_fitness`` is the mean of the parents, ``child_fitness`` the crossover child's score before mutation"""
+        self.pending.append((offspring_index, parent_fitness, child_fitness, crossover_op, mutation_op))
+
+    # Credit operators with the fitness gain of the offspring they produced
+    def update(self, generation, fitness_scores):
+        crossover_rewards = {op: [] for op in self.crossover_ops}
+        mutation_rewards = {op: [] for op in self.mutation_ops}
+        successes = 0
+
+        for index, parent_fitness, child_fitness, crossover_op, mutation_op in self.pending:
+            if self.previous_median is not None and fitness_scores[index] > self.previous_median:
+                successes += 1
+            if crossover_op in crossover_rewards:
+                crossover_rewards[crossover_op].append(max(0.0, child_fitness - parent_fitness))
+            if mutation_op in mutation_rewards:
+                mutation_rewards[mutation_op].append(max(0.0, fitness_scores[index] - child_fitness))
+
+        for quality, rewards in ((self.crossover_quality, crossover_rewards),
+                                 (self.mutation_quality, mutation_rewards)):
+            for op, values in rewards.items():
+                if values:
+                    mean_reward = sum(values) / len(values)
+                    quality[op] += self.learning_rate * (mean_reward - quality[op])
+
+        success_rate = successes / len(self.pending) if self.pending else None
+        if success_rate is not None:
+            # Median success rule: explore more while it pays off, less otherwise
+            if success_rate > 0.5:
+                self.mutation_rate *= 1.1
+            else:
+                self.mutation_rate *= 0.9
+            self.mutation_rate = min(self.max_mutation_rate,
+                                     max(self.min_mutation_rate, self.mutation_rate))
+
+        ranked = sorted(fitness_scores)
+        self.previous_median = ranked[len(ranked) // 2] if ranked else None
+
+        # Anneal changes per gene with the relative fitness spread
+        best = max(fitness_scores) if fitness_scores else 0
+        spread = (best - min(fitness_scores)) / best if best > 0 else 0
+        self.max_mutations = max(1, min(self.max_mutations_limit,
+                                        1 + round((self.max_mutations_limit - 1) * spread)))
+
+        self.history.append({
+            'generation': generation,
+            'offspring': len(self.pending),
+            'success_rate': success_rate,
+            'fitness_spread': round(spread, 4),
+            'mutation_rate': round(self.mutation_rate, 4),
+            'max_mutations': self.max_mutations,
+            'crossover_probs': {op: round(p, 4) for op, p in self.crossover_probabilities().items()},
+            'mutation_probs': {op: round(p, 4) for op, p in self.mutation_probabilities().items()},
+        })
+        self.pending = []
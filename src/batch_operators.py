@@ -0,0 +1,190 @@
+# src/batch_operators.py
+import numpy as np
+import pandas as pd
+from .utils import split_hours
+
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+FIRST_HOUR = 8
+LAST_HOUR = 16
+UNPLACED = -1
+
+
+class PopulationEncoding:
+    """Whole-population array form of timetables and operators that work on it.
+
+    Every lecture/lab block the course data asks for is one gene, laid out
+    in the order create_individual schedules them. A population is three
+    ``(population, genes)`` integer matrices: day index, start hour and
+    room index, with ``-1`` for blocks that were never placed. Crossover and
+    mutation draw all their masks and replacement values in a few vectorized
+    RNG calls and return a full offspring generation at once.
+    """
+
+    def __init__(self, df, classrooms):
+        self.classrooms = list(classrooms)
+        self.genes = []
+        for _, row in df.iterrows():
+            hours = int(row['Hours']) if pd.notna(row['Hours']) else 0
+            if hours <= 0:
+                continue
+            lectures, labs = split_hours(hours)
+            blocks = [('Theory', d) for d in lectures] + [('Lab', d) for d in labs]
+            for block_type, duration in blocks:
+                self.genes.append({
+                    'Class': str(row['Class']),
+                    'Subject': str(row['Subject']),
+                    'Faculty': str(row['Faculty']),
+                    'Code': str(row['Code']) if 'Code' in row else '',
+                    'Type': block_type,
+                    'Duration': duration,
+                    'Total Hours': hours,
+                })
+
+        self.durations = np.array([g['Duration'] for g in self.genes], dtype=np.int16)
+        self.is_lab = np.array([g['Type'] == 'Lab' for g in self.genes], dtype=bool)
+        self.lab_rooms = np.array([i for i, r in enumerate(self.classrooms) if 'Lab' in r], dtype=np.int16)
+        self.theory_rooms = np.array([i for i, r in enumerate(self.classrooms) if 'Lab' not in r], dtype=np.int16)
+
+    @property
+    def num_genes(self):
+        return len(self.genes)
+
+    # List-of-dicts timetables -> (days, starts, rooms) matrices
+    def encode(self, population):
+        shape = (len(population), self.num_genes)
+        days = np.full(shape, UNPLACED, dtype=np.int16)
+        starts = np.full(shape, UNPLACED, dtype=np.int16)
+        rooms = np.full(shape, UNPLACED, dtype=np.int16)
+        room_index = {r: i for i, r in enumerate(self.classrooms)}
+        day_index = {d: i for i, d in enumerate(DAYS)}
+
+        for p, timetable in enumerate(population):
+            # Match entries to genes by class, subject, type and duration, in order
+            pending = {}
+            for entry in timetable:
+                key = (entry['Class'], entry['Subject'], entry['Type'], int(entry['Duration'].split()[0]))
+                pending.setdefault(key, []).append(entry)
+            for g, gene in enumerate(self.genes):
+                queue = pending.get((gene['Class'], gene['Subject'], gene['Type'], gene['Duration']))
+                if not queue:
+                    continue
+                entry = queue.pop(0)
+                days[p, g] = day_index[entry['Day']]
+                starts[p, g] = int(entry['Time Slot'].split(':')[0])
+                rooms[p, g] = room_index[entry['Room']]
+        return days, starts, rooms
+
+    # (days, starts, rooms) matrices -> list-of-dicts timetables
+    def decode(self, days, starts, rooms):
+        population = []
+        for p in range(days.shape[0]):
+            timetable = []
+            for g in np.flatnonzero(days[p] >= 0):
+                gene = self.genes[g]
+                duration = gene['Duration']
+                start_hour = int(starts[p, g])
+                end_hour = start_hour + duration
+                timetable.append({
+                    'Class': gene['Class'],
+                    'Subject': gene['Subject'],
+                    'Faculty': gene['Faculty'],
+                    'Code': gene['Code'],
+                    'Type': gene['Type'],
+                    'Day': DAYS[days[p, g]],
+                    'Start Time': f"{start_hour:02d}:00",
+                    'End Time': f"{end_hour:02d}:00",
+                    'Duration': f"{duration} hour{'s' if duration>1 else ''}",
+                    'Time Slot': f"{start_hour:02d}:00-{end_hour:02d}:00",
+                    'Room': self.classrooms[rooms[p, g]],
+                    'Total Hours': gene['Total Hours'],
+                })
+            population.append(timetable)
+        return population
+
+    def crossover(self, days, starts, rooms, pairs, strategies, rng):
+        """Breed one offspring per row of ``pairs`` (parent indices).
+
+        ``strategies`` holds one index per offspring into
+        single_point/two_point/uniform, matching ``crossover``'s cut points.
+        """
+        num_offspring = len(pairs)
+        position = np.arange(self.num_genes)
+        single_point = position < self.num_genes // 2
+        two_point = (position < self.num_genes // 3) | (position >= (2 * self.num_genes) // 3)
+        uniform = rng.random((num_offspring, self.num_genes)) < 0.5
+
+        # True where the gene comes from the first parent
+        from_first = np.where(strategies[:, None] == 0, single_point,
+                              np.where(strategies[:, None] == 1, two_point, uniform))
+        first, second = pairs[:, 0], pairs[:, 1]
+        return (np.where(from_first, days[first], days[second]),
+                np.where(from_first, starts[first], starts[second]),
+                np.where(from_first, rooms[first], rooms[second]))
+
+    def mutate(self, days, starts, rooms, rng, mutation_rate=0.5, max_mutations=3, weights=None,
+               operators=None):
+        """Mutate a whole population in place of ``mutate``'s per-gene loop.
+
+        Each placed gene mutates with ``mutation_rate``, applying 1 to
+        ``max_mutations`` day/time/room/swap changes drawn with ``weights``,
+        or of the single type ``operators`` gives for each row.
+        Rooms stay within ``Lab-*`` for labs and ``Room-*`` for theory.
+        Returns the new matrices and a ``(population, 4)`` mask of which
+        mutation types touched each individual.
+        """
+        days, starts, rooms = days.copy(), starts.copy(), rooms.copy()
+        shape = days.shape
+        placed = days >= 0
+        selected = placed & (rng.random(shape) < mutation_rate)
+        counts = rng.integers(1, max_mutations + 1, shape)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+            weights = weights / weights.sum()
+        applied = np.zeros((shape[0], 4), dtype=bool)
+
+        for step in range(max_mutations):
+            active = selected & (counts > step)
+            if operators is not None:
+                ops = np.broadcast_to(np.asarray(operators)[:, None], shape)
+            else:
+                ops = rng.choice(4, size=shape, p=weights)
+
+            # day
+            mask = active & (ops == 0)
+            days = np.where(mask, rng.integers(0, len(DAYS), shape), days)
+            applied[:, 0] |= mask.any(axis=1)
+
+            # time: any start that keeps the block inside the teaching day
+            mask = active & (ops == 1)
+            latest = LAST_HOUR - self.durations
+            new_starts = FIRST_HOUR + (rng.random(shape) * (latest - FIRST_HOUR + 1)).astype(np.int16)
+            starts = np.where(mask, new_starts, starts)
+            applied[:, 1] |= mask.any(axis=1)
+
+            # room, from the pool matching the block type
+            mask = active & (ops == 2)
+            if len(self.lab_rooms) and len(self.theory_rooms):
+                new_rooms = np.where(self.is_lab,
+                                     self.lab_rooms[rng.integers(0, len(self.lab_rooms), shape)],
+                                     self.theory_rooms[rng.integers(0, len(self.theory_rooms), shape)])
+                rooms = np.where(mask, new_rooms, rooms)
+                applied[:, 2] |= mask.any(axis=1)
+
+            # swap: exchange day and start between disjoint pairs of placed, equal-length
+            # genes (a random permutation's first half against its second half), rooms stay put
+            if self.num_genes > 1:
+                half = self.num_genes // 2
+                order = np.argsort(rng.random(shape), axis=1)
+                a, b = order[:, :half], order[:, half:2 * half]
+                rows = np.arange(shape[0])[:, None]
+                wants = active & (ops == 3)
+                mask = ((wants[rows, a] | wants[rows, b])
+                        & (days[rows, a] >= 0) & (days[rows, b] >= 0)
+                        & (self.durations[a] == self.durations[b]))
+                r, i = np.nonzero(mask)
+                a, b = a[r, i], b[r, i]
+                days[r, a], days[r, b] = days[r, b], days[r, a]
+                starts[r, a], starts[r, b] = starts[r, b], starts[r, a]
+                applied[:, 3] |= mask.any(axis=1)
+
+        return days, starts, rooms, applied
@@ -0,0 +1,112 @@
+# src/feasibility.py
+import math
+import pandas as pd
+from .utils import split_hours
+
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+SLOTS_PER_DAY = 8  # 08:00-16:00, as searched by find_consecutive_slots
+UNSCHEDULED_PENALTY = 50  # per missing block, as in calculate_fitness
+
+
+def analyze_feasibility(df, classrooms, max_class_theory_hours=4, max_class_hours=6,
+                        max_faculty_hours=7, days=DAYS, slots_per_day=SLOTS_PER_DAY):
+    """Compare weekly demand with capacity for every class, faculty member and room type.
+
+    Returns a report dict with ``feasible``, a list of ``errors`` (provably
+    unschedulable demand), a list of ``warnings`` (tight but possible), the
+    per-resource ``demand``/``capacity`` tables and a lower bound on blocks
+    that can never be placed together with the penalty it costs.
+    """
+    num_days = len(days)
+    errors = []
+    warnings = []
+    class_theory = {}
+    class_total = {}
+    class_dropped = {}
+    faculty_total = {}
+    faculty_max_block = {}
+    room_demand = {'Theory': 0, 'Lab': 0}
+    room_max_block = {'Theory': 0, 'Lab': 0}
+
+    for idx, row in df.iterrows():
+        hours = int(row['Hours']) if pd.notna(row['Hours']) else 0
+        if hours <= 0:
+            warnings.append(f"Row {idx} ({row.get('Class')} {row.get('Subject')}): no hours, skipped")
+            continue
+
+        class_name = str(row['Class'])
+        subject = str(row['Subject'])
+        faculties = [f.strip() for f in str(row['Faculty']).split(';')]
+        lectures, labs = split_hours(hours)
+        theory_hours = sum(lectures)
+        lab_hours = sum(labs)
+
+        class_theory[class_name] = class_theory.get(class_name, 0) + theory_hours
+        class_total[class_name] = class_total.get(class_name, 0) + theory_hours + lab_hours
+        for faculty in faculties:
+            faculty_total[faculty] = faculty_total.get(faculty, 0) + theory_hours + lab_hours
+            faculty_max_block[faculty] = max(faculty_max_block.get(faculty, 0), max(lectures + labs))
+        room_demand['Theory'] += theory_hours
+        room_demand['Lab'] += lab_hours
+        room_max_block['Theory'] = max(room_max_block['Theory'], max(lectures, default=0))
+        room_max_block['Lab'] = max(room_max_block['Lab'], max(labs, default=0))
+
+        # Every block of a subject needs its own day
+        blocks = len(lectures) + len(labs)
+        if blocks > num_days:
+            errors.append(f"{class_name} {subject}: {blocks} blocks for {hours} hours "
+                          f"but only {num_days} days to spread them over")
+            class_dropped[class_name] = class_dropped.get(class_name, 0) + blocks - num_days
+
+    capacity = {
+        'class_theory': num_days * min(max_class_theory_hours, slots_per_day),
+        'class_total': num_days * min(max_class_hours, slots_per_day),
+        'faculty': num_days * min(max_faculty_hours, slots_per_day),
+        'Theory': len([r for r in classrooms if 'Lab' not in r]) * num_days * slots_per_day,
+        'Lab': len([r for r in classrooms if 'Lab' in r]) * num_days * slots_per_day,
+    }
+
+    def check(label, demand, cap, max_block):
+        # Excess hours translate into at least ceil(excess / longest block) missing blocks
+        if demand > cap:
+            errors.append(f"{label}: {demand} hours needed, at most {cap} schedulable")
+            return math.ceil((demand - cap) / max(1, max_block))
+        if demand > 0.9 * cap:
+            warnings.append(f"{label}: {demand} of {cap} schedulable hours used")
+        return 0
+
+    # Classes are disjoint, so their missing blocks add up
+    class_bound = 0
+    for class_name in class_total:
+        class_bound += max(
+            class_dropped.get(class_name, 0),
+            check(f"Class {class_name} theory", class_theory[class_name], capacity['class_theory'], 2),
+            check(f"Class {class_name}", class_total[class_name], capacity['class_total'], 2),
+        )
+
+    # A co-taught block serves several faculty, so only the worst one is certain
+    faculty_bound = 0
+    for faculty, demand in faculty_total.items():
+        faculty_bound = max(faculty_bound, check(f"Faculty {faculty}", demand, capacity['faculty'],
+                                                 faculty_max_block[faculty]))
+
+    room_bound = 0
+    for room_type in ('Theory', 'Lab'):
+        room_bound += check(f"{room_type} rooms", room_demand[room_type],
+                            capacity[room_type], room_max_block[room_type])
+
+    min_unscheduled = max(class_bound, faculty_bound, room_bound)
+    return {
+        'feasible': not errors,
+        'errors': errors,
+        'warnings': warnings,
+        'demand': {
+            'class_theory': class_theory,
+            'class_total': class_total,
+            'faculty': faculty_total,
+            'rooms': room_demand,
+        },
+        'capacity': capacity,
+        'min_unscheduled_blocks': min_unscheduled,
+        'penalty_lower_bound': min_unscheduled * UNSCHEDULED_PENALTY,
+    }
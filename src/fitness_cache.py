@@ -0,0 +1,59 @@
+# src/fitness_cache.py
+from collections import OrderedDict
+
+# Entry fields that calculate_fitness looks at
+KEY_FIELDS = ('Class', 'Faculty', 'Type', 'Day', 'Time Slot', 'Room')
+
+
+def timetable_key(timetable):
+    """Tuple of the fields that decide a timetable's fitness, in entry order.
+
+    The tuple itself is used as the cache key, so two timetables only share
+    a score when those fields are equal; a hash collision can't return
+    another timetable's fitness. Its ``hash()`` is salted per process (string
+    hashing), so keys are stable within one run but hashes must not be
+    persisted or compared across processes.
+    """
+    return tuple(tuple(entry[field] for field in KEY_FIELDS) for entry in timetable)
+
+
+class FitnessCache:
+    """Bounded LRU map from timetable key to fitness score"""
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, fitness):
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -1,12 +1,59 @@
 import random
+import warnings
+import numpy as np
 import pandas as pd
-from .utils import generate_time_slots, generate_classrooms, load_data
+from .utils import generate_time_slots, generate_classrooms, load_data, split_hours
+from .feasibility import analyze_feasibility
+from .fitness_cache import FitnessCache, timetable_key
+from .batch_operators import PopulationEncoding
+from .adaptive import AdaptiveOperatorControl, CROSSOVER_OPERATORS, MUTATION_OPERATORS
 
 class GeneticAlgorithmTimetable:
-    def __init__(self, csv_file="timetable_data.csv"):
+    # Daily hour caps enforced while building a timetable
+    max_class_theory_hours = 4
+    max_class_hours = 6
+    max_faculty_hours = 7
+    
+    def __init__(self, csv_file="timetable_data.csv", cache_size=1024):
         self.df = load_data(csv_file)
         self.time_slots = generate_time_slots()
         self.classrooms = generate_classrooms()
+        self.fitness_cache = FitnessCache(max_size=cache_size)
+        self.adaptation_history = []
+        self.feasibility_report = None
+        self.expected_blocks = None
+    
+    # Number of lecture/lab blocks the course data asks for
+    def count_expected_blocks(self):
+        total = 0
+        for hours in self.df['Hours']:
+            hours = int(hours) if pd.notna(hours) else 0
+            if hours > 0:
+                lectures, labs = split_hours(hours)
+                total += len(lectures) + len(labs)
+        return total
+    
+    # Check capacity against demand before spending generations on it
+    def check_feasibility(self):
+        """Run the capacity analysis on the loaded data and keep the report"""
+        self.feasibility_report = analyze_feasibility(
+            self.df, self.classrooms,
+            max_class_theory_hours=self.max_class_theory_hours,
+            max_class_hours=self.max_class_hours,
+            max_faculty_hours=self.max_faculty_hours)
+        return self.feasibility_report
+    
+    def ensure_feasible(self, strict=False):
+        """Warn about, or with ``strict`` refuse, provably infeasible data"""
+        report = self.check_feasibility()
+        if not report['feasible']:
+            message = ("Timetable data is over-constrained (at least "
+                       f"{report['min_unscheduled_blocks']} blocks cannot be placed):\n"
+                       + "\n".join(report['errors']))
+            if strict:
+                raise ValueError(message)
+            warnings.warn(message)
+        return report
     
     # Convert hours to lecture blocks
     def get_lecture_blocks(self, hours):
@@ -76,36 +123,7 @@ class GeneticAlgorithmTimetable:
             subject_type = str(row['Type']) if 'Type' in row else 'Theory'
             
             # Determine lecture and lab distribution based on credit hours
-            lectures = []
-            labs = []
-            
-            if hours == 3:
-                # 3 credit hours: 2 theory lectures (1.5 each, rounded to 1-2 hours) + 1 lab (1 hour)
-                lectures = [2, 1]  # 2 lectures: 2 hours and 1 hour
-                labs = [1]  # 1 lab: 1 hour
-            elif hours == 2:
-                # 2 credit hours: 1 theory lecture (2 hours)
-                lectures = [2]
-                labs = []
-            elif hours == 1:
-                # 1 credit hour: 1 lecture (1 hour)
-                lectures = [1]
-                labs = []
-            else:
-                # For other hours, distribute appropriately
-                while hours > 0:
-                    if hours >= 3:
-                        lectures.append(2)
-                        hours -= 2
-                        if hours >= 1:
-                            labs.append(1)
-                            hours -= 1
-                    elif hours >= 2:
-                        lectures.append(2)
-                        hours -= 2
-                    else:
-                        lectures.append(1)
-                        hours -= 1
+            lectures, labs = split_hours(hours)
             
             # Schedule all lectures on different days
             used_days_for_subject = set()
@@ -118,6 +136,8 @@ class GeneticAlgorithmTimetable:
                 for attempt in range(max_attempts):
                     if not available_days:
                         available_days = [d for d in days if d not in used_days_for_subject]
+                        if not available_days:
+                            break  # every day already has a block of this subject
                     
                     day = random.choice(available_days)
                     available_slots = self.find_consecutive_slots(day, lecture_duration, used_slots)
@@ -160,12 +180,12 @@ class GeneticAlgorithmTimetable:
                         continue
                     
                     # Check daily hour limits (increased from 4 to 6 hours)
-                    if daily_class_hours.get((class_name, day),0) + lecture_duration > 4:
+                    if daily_class_hours.get((class_name, day),0) + lecture_duration > self.max_class_theory_hours:
                         continue
                     
                     faculty_conflict = False
                     for faculty in faculties:
-                        if daily_faculty_hours.get((faculty, day),0) + lecture_duration > 7:  # Increased from 5 to 7
+                        if daily_faculty_hours.get((faculty, day),0) + lecture_duration > self.max_faculty_hours:  # Increased from 5 to 7
                             faculty_conflict = True
                             break
                     if faculty_conflict:
@@ -209,6 +229,8 @@ class GeneticAlgorithmTimetable:
                 for attempt in range(max_attempts):
                     if not available_days:
                         available_days = [d for d in days if d not in used_days_for_subject]
+                        if not available_days:
+                            break  # every day already has a block of this subject
                     
                     day = random.choice(available_days)
                     available_slots = self.find_consecutive_slots(day, lab_duration, used_slots)
@@ -251,12 +273,12 @@ class GeneticAlgorithmTimetable:
                         continue
                     
                     # Check daily hour limits
-                    if daily_class_hours.get((class_name, day),0) + lab_duration > 6:
+                    if daily_class_hours.get((class_name, day),0) + lab_duration > self.max_class_hours:
                         continue
                     
                     faculty_conflict = False
                     for faculty in faculties:
-                        if daily_faculty_hours.get((faculty, day),0) + lab_duration > 7:
+                        if daily_faculty_hours.get((faculty, day),0) + lab_duration > self.max_faculty_hours:
                             faculty_conflict = True
                             break
                     if faculty_conflict:
@@ -297,9 +319,16 @@ class GeneticAlgorithmTimetable:
         if not timetable:
             return 0
         
+        # Elites, re-selected parents and converged duplicates score the same
+        cache_key = timetable_key(timetable)
+        cached = self.fitness_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Count how many classes were actually scheduled
         scheduled_count = len(timetable)
-        total_expected = len(self.df)  # Total classes that should be scheduled
+        # Total lecture/lab blocks that should be scheduled
+        total_expected = self.expected_blocks if self.expected_blocks is not None else self.count_expected_blocks()
         
         # Penalty for unscheduled classes (most important!)
         if total_expected > 0:
@@ -335,16 +364,19 @@ class GeneticAlgorithmTimetable:
         # Normalize to percentage
         normalized_fitness = (fitness / max_fitness) * 100
         
-        return round(normalized_fitness, 2)
+        normalized_fitness = round(normalized_fitness, 2)
+        self.fitness_cache.put(cache_key, normalized_fitness)
+        return normalized_fitness
     
     # CROSSOVER: Breed two good timetables
-    def crossover(self, parent1, parent2):
+    def crossover(self, parent1, parent2, strategy=None):
         """Combine two timetables to create offspring"""
         if not parent1 or not parent2:
             return self.create_individual()
         
         # Use multiple crossover strategies for better diversity
-        strategy = random.choice(['single_point', 'two_point', 'uniform'])
+        if strategy is None:
+            strategy = random.choice(CROSSOVER_OPERATORS)
         
         if strategy == 'single_point':
             # Take first half from parent1, second half from parent2
@@ -366,20 +398,22 @@ class GeneticAlgorithmTimetable:
         return offspring
     
     # MUTATION: Randomly modify a timetable
-    def mutate(self, timetable):
-        """Randomly change some classes in the timetable"""
+    def mutate(self, timetable, mutation_rate=0.5, max_mutations=3, weights=None):
+        """Randomly change some classes in the timetable.
+
+        ``weights`` biases the choice between mutation types.
+        """
         if not timetable or len(timetable) == 0:
             return timetable
         
         mutated = [entry.copy() for entry in timetable]
-        mutation_rate = 0.5  # 50% chance to mutate
         
         for i, entry in enumerate(mutated):
             if random.random() < mutation_rate:
-                # Apply 1-3 mutations per entry for more aggressive changes
-                num_mutations = random.randint(1, 3)
+                # Apply 1-max_mutations mutations per entry for more aggressive changes
+                num_mutations = random.randint(1, max_mutations)
                 for _ in range(num_mutations):
-                    mutation_type = random.choice(['day', 'time', 'room', 'swap'])
+                    mutation_type = random.choices(MUTATION_OPERATORS, weights=weights)[0]
                     
                     if mutation_type == 'day':
                         days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
@@ -424,8 +458,27 @@ class GeneticAlgorithmTimetable:
         parents = [population[i] for i in sorted_indices[:num_parents]]
         return parents
     
-    def run(self, generations=50, population_size=20):
-        """Run true Genetic Algorithm with selection, crossover, and mutation"""
+    def run(self, generations=50, population_size=20, adaptive=True, strict=False,
+            replace_duplicates=False, progress=None):
+        """Run true Genetic Algorithm with selection, crossover, and mutation.
+
+        The input is checked with ``check_feasibility`` first; provably
+        infeasible data raises ``ValueError`` when ``strict`` and warns otherwise.
+        Fitness scores are memoized in ``self.fitness_cache``; with
+        ``replace_duplicates`` offspring identical to one already in the new
+        generation are swapped for fresh random timetables. ``progress``, if
+        given, is called as ``progress(generation, generations, best_fitness)``
+        after each generation is scored.
+
+        With ``adaptive`` the crossover strategy, mutation types and mutation
+        rate are tuned every generation from the fitness gains they produce;
+        the per-generation settings end up in ``self.adaptation_history``.
+        """
+        self.ensure_feasible(strict)
+        self.fitness_cache.clear()
+        self.expected_blocks = self.count_expected_blocks()
+        control = AdaptiveOperatorControl() if adaptive else None
+        self.adaptation_history = control.history if control else []
         population = [self.create_individual() for _ in range(population_size)]
         best_individual = None
         best_fitness = 0
@@ -436,6 +489,10 @@ class GeneticAlgorithmTimetable:
             # Calculate fitness for all individuals
             fitness_scores = [self.calculate_fitness(individual) for individual in population]
             
+            # Credit the operators that produced this generation
+            if control:
+                control.update(gen, fitness_scores)
+            
             # Track best in this generation
             current_best_idx = fitness_scores.index(max(fitness_scores))
             current_best_fitness = fitness_scores[current_best_idx]
@@ -448,6 +505,8 @@ class GeneticAlgorithmTimetable:
                 no_improvement_count += 1
             
             fitness_history.append(best_fitness)
+            if progress:
+                progress(gen + 1, generations, best_fitness)
             
             # If no improvement for 5+ generations, inject new random solutions
             if no_improvement_count > 5:
@@ -462,20 +521,135 @@ class GeneticAlgorithmTimetable:
             
             # SELECTION: Select best parents
             parents = self.selection(population, fitness_scores, num_parents=6)  # Increased from 4 to 6
+            parent_scores = {id(ind): score for ind, score in zip(population, fitness_scores)}
             
             # Create new generation
             new_population = [best_individual]  # Keep best (elitism)
+            if replace_duplicates:
+                seen = {timetable_key(best_individual)} if best_individual is not None else set()
             
             while len(new_population) < population_size:
                 # CROSSOVER: Breed parents
                 parent1, parent2 = random.sample(parents, 2)
-                offspring = self.crossover(parent1, parent2)
+                if control:
+                    strategy = control.choose_crossover()
+                    offspring = self.crossover(parent1, parent2, strategy=strategy)
+                    child_fitness = self.calculate_fitness(offspring)
+                    
+                    # MUTATION: one adaptively chosen mutation type per offspring, so it gets the credit
+                    mutation_type = control.choose_mutation()
+                    offspring = self.mutate(offspring,
+                                            mutation_rate=control.mutation_rate,
+                                            max_mutations=control.max_mutations,
+                                            weights=[op == mutation_type for op in MUTATION_OPERATORS])
+                else:
+                    offspring = self.crossover(parent1, parent2)
+                    
+                    # MUTATION: Mutate offspring (aggressive mutation)
+                    offspring = self.mutate(offspring)
                 
-                # MUTATION: Mutate offspring (aggressive mutation)
-                offspring = self.mutate(offspring)
+                # Don't spend a slot on a copy of a timetable we already have
+                if replace_duplicates:
+                    key = timetable_key(offspring)
+                    if key in seen:
+                        new_population.append(self.create_individual())
+                        continue
+                    seen.add(key)
                 
+                if control:
+                    parent_fitness = (parent_scores[id(parent1)] + parent_scores[id(parent2)]) / 2
+                    control.record(len(new_population), parent_fitness, child_fitness,
+                                   strategy, mutation_type)
                 new_population.append(offspring)
             
             population = new_population
         
         return best_individual, best_fitness
+    
+    def run_batched(self, generations=50, population_size=20, adaptive=True, strict=False,
+                    progress=None):
+        """Same search as ``run``, but each generation's offspring are bred and
+        mutated together on array-encoded populations (see ``PopulationEncoding``).
+        """
+        self.ensure_feasible(strict)
+        self.fitness_cache.clear()
+        self.expected_blocks = self.count_expected_blocks()
+        control = AdaptiveOperatorControl() if adaptive else None
+        self.adaptation_history = control.history if control else []
+        rng = np.random.default_rng(random.getrandbits(32))
+        encoding = PopulationEncoding(self.df, self.classrooms)
+        
+        days, starts, rooms = encoding.encode([self.create_individual() for _ in range(population_size)])
+        best_individual = None
+        best_genes = None
+        best_fitness = 0
+        no_improvement_count = 0
+        num_parents = min(6, population_size)
+        num_offspring = population_size - 1
+        
+        for gen in range(generations):
+            population = encoding.decode(days, starts, rooms)
+            fitness_scores = [self.calculate_fitness(individual) for individual in population]
+            
+            if control:
+                control.update(gen, fitness_scores)
+            
+            current_best_idx = fitness_scores.index(max(fitness_scores))
+            # The elite row is needed for breeding even if nothing has scored yet
+            if best_genes is None or fitness_scores[current_best_idx] > best_fitness:
+                best_genes = (days[current_best_idx].copy(), starts[current_best_idx].copy(),
+                              rooms[current_best_idx].copy())
+            if fitness_scores[current_best_idx] > best_fitness:
+                best_fitness = fitness_scores[current_best_idx]
+                best_individual = population[current_best_idx]
+                no_improvement_count = 0
+            else:
+                no_improvement_count += 1
+            if progress:
+                progress(gen + 1, generations, best_fitness)
+            
+            # Diversity injection, as in run
+            if no_improvement_count > 5:
+                worst = np.argsort(fitness_scores)[:max(1, population_size // 3)]
+                fresh = encoding.encode([self.create_individual() for _ in range(len(worst))])
+                days[worst], starts[worst], rooms[worst] = fresh
+                no_improvement_count = 0
+                continue
+            
+            if num_offspring < 1 or num_parents < 2:
+                continue
+            
+            # SELECTION: top parents, two distinct ones per offspring
+            parents = np.argsort(fitness_scores)[::-1][:num_parents]
+            first = rng.integers(0, num_parents, num_offspring)
+            second = (first + rng.integers(1, num_parents, num_offspring)) % num_parents
+            pairs = np.stack([parents[first], parents[second]], axis=1)
+            
+            # CROSSOVER and MUTATION for the whole generation at once
+            if control:
+                probs = control.crossover_probabilities()
+                strategies = rng.choice(len(CROSSOVER_OPERATORS), size=num_offspring,
+                                        p=[probs[op] for op in CROSSOVER_OPERATORS])
+                offspring = encoding.crossover(days, starts, rooms, pairs, strategies, rng)
+                child_scores = [self.calculate_fitness(child) for child in encoding.decode(*offspring)]
+                mutation_probs = control.mutation_probabilities()
+                mutation_types = rng.choice(len(MUTATION_OPERATORS), size=num_offspring,
+                                            p=[mutation_probs[op] for op in MUTATION_OPERATORS])
+                *offspring, _ = encoding.mutate(*offspring, rng,
+                                                mutation_rate=control.mutation_rate,
+                                                max_mutations=control.max_mutations,
+                                                operators=mutation_types)
+                for i in range(num_offspring):
+                    parent_fitness = (fitness_scores[pairs[i, 0]] + fitness_scores[pairs[i, 1]]) / 2
+                    control.record(i + 1, parent_fitness, child_scores[i],
+                                   CROSSOVER_OPERATORS[strategies[i]], MUTATION_OPERATORS[mutation_types[i]])
+            else:
+                strategies = rng.integers(0, len(CROSSOVER_OPERATORS), num_offspring)
+                offspring = encoding.crossover(days, starts, rooms, pairs, strategies, rng)
+                *offspring, _ = encoding.mutate(*offspring, rng)
+            
+            # Keep best (elitism) in row 0
+            days, starts, rooms = (np.vstack([best[None, :], child])
+                                   for best, child in zip(best_genes, offspring))
+        
+        return best_individual, best_fitness
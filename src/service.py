@@ -0,0 +1,369 @@
+# src/service.py
+"""Local HTTP service around GeneticAlgorithmTimetable.
+
+Run with ``python -m src.service --port 8000 --workers 2``.
+
+    POST /jobs                 course data as text/csv or application/json
+                               (a list of row objects, or {"rows": [...]});
+                               query: generations, population_size, batched, strict
+    GET  /jobs/<id>            status and progress
+    GET  /jobs/<id>/result     timetable as CSV in the final_timetable.csv
+                               schema (?format=json for JSON rows)
+    GET  /health               worker and queue counts; 503 if the worker pool is broken
+
+Solves run on a pool of worker processes that stay alive between
+requests, so pandas and the GA are imported once per worker, not per solve.
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+
+from .ga_timetable import GeneticAlgorithmTimetable
+
+REQUIRED_COLUMNS = ['Class', 'Subject', 'Hours', 'Faculty']
+RESULT_COLUMNS = ['Class', 'Subject', 'Faculty', 'Code', 'Type', 'Day', 'Start Time',
+                  'End Time', 'Duration', 'Time Slot', 'Room', 'Total Hours']
+CHUNK_ROWS = 200
+
+# Set in each worker process by _init_worker
+_progress_queue = None
+
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _worker_pid():
+    return os.getpid()
+
+
+def _solve(job_id, df, generations, population_size, batched, strict):
+    """Worker entry point: run one solve and report progress on the shared queue"""
+    def progress(gen, total, best_fitness):
+        _progress_queue.put((job_id, gen, total, best_fitness))
+
+    ga = GeneticAlgorithmTimetable(csv_file=df)
+    run = ga.run_batched if batched else ga.run
+    timetable, fitness = run(generations=generations, population_size=population_size,
+                             strict=strict, progress=progress)
+    report = ga.feasibility_report
+    return {
+        'timetable': timetable or [],
+        'fitness': fitness,
+        'feasibility': {key: report[key] for key in
+                        ('feasible', 'errors', 'warnings', 'min_unscheduled_blocks', 'penalty_lower_bound')},
+        'cache': ga.fitness_cache.stats(),
+    }
+
+
+def parse_course_data(body, content_type):
+    """Course rows from a CSV or JSON request body, or ValueError"""
+    if 'json' in content_type:
+        payload = json.loads(body)
+        if isinstance(payload, dict):
+            payload = payload.get('rows', [])
+        df = pd.DataFrame(payload)
+    else:
+        df = pd.read_csv(io.StringIO(body.decode('utf-8')))
+    df.columns = df.columns.str.strip()
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    if df.empty:
+        raise ValueError("No course rows")
+    return df
+
+
+class SolveService:
+    """Bounded job queue in front of a warm process pool"""
+
+    def __init__(self, workers=2, max_pending=16, max_finished=200):
+        self.context = multiprocessing.get_context()
+        self.progress_queue = self.context.Queue()
+        self.workers = workers
+        self.executor = self._make_executor()
+        self.broken_executor = None
+        self.restart_lock = threading.Lock()
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self.jobs = {}
+        self.finished = []
+        self.lock = threading.Lock()
+        self.progress_thread = threading.Thread(target=self._collect_progress, daemon=True)
+        self.progress_thread.start()
+
+    def _make_executor(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context,
+                                   initializer=_init_worker,
+                                   initargs=(self.progress_queue,))
+
+    # Pre-start every worker so the first requests don't pay for process startup
+    def warm_up(self):
+        futures = [self.executor.submit(_worker_pid) for _ in range(self.workers)]
+        return sorted({f.result() for f in futures})
+
+    @property
+    def pool_broken(self):
+        return self.broken_executor is self.executor
+
+    def restart(self, failed_executor):
+        """Replace ``failed_executor`` with a fresh, warmed pool.
+
+        Does nothing if another thread already replaced it, so concurrent
+        failures rebuild the pool once and never discard a healthy one.
+        """
+        with self.restart_lock:
+            if self.executor is not failed_executor:
+                return
+            self.executor = self._make_executor()
+            failed_executor.shutdown(wait=False, cancel_futures=True)
+            self.warm_up()
+
+    def pool_ok(self):
+        """False once a worker has died, without adding work to the pool.
+
+        Breakage is recorded by failed jobs and failed submits; ``_broken``
+        also catches a worker that died while idle.
+        """
+        executor = self.executor
+        if getattr(executor, '_broken', False):
+            self.broken_executor = executor
+        return not self.pool_broken
+
+    def _collect_progress(self):
+        while True:
+            item = self.progress_queue.get()
+            if item is None:
+                return
+            job_id, gen, total, best_fitness = item
+            with self.lock:
+                job = self.jobs.get(job_id)
+                if job and job['status'] in ('queued', 'running'):
+                    job['status'] = 'running'
+                    job['progress'] = {'generation': gen, 'generations': total,
+                                       'best_fitness': best_fitness}
+
+    def pending_count(self):
+        return sum(1 for job in self.jobs.values() if job['status'] in ('queued', 'running'))
+
+    def submit(self, df, generations=30, population_size=20, batched=False, strict=False):
+        """Queue a solve and return its job id, or None when the queue is full.
+
+        A pool already known to be broken is rebuilt first, and a submit that
+        fails on a broken pool is retried once on a rebuilt one. Raises
+        RuntimeError only if that retry fails too.
+        """
+        job_id = uuid.uuid4().hex
+        with self.lock:
+            if self.pending_count() >= self.max_pending:
+                return None
+            self.jobs[job_id] = {
+                'status': 'queued',
+                'submitted': time.time(),
+                'finished': None,
+                'progress': {'generation': 0, 'generations': generations, 'best_fitness': 0},
+                'result': None,
+                'error': None,
+            }
+        args = (_solve, job_id, df, generations, population_size, batched, strict)
+        try:
+            future, executor = self._submit_with_restart(*args)
+        except RuntimeError as e:
+            with self.lock:
+                self.jobs.pop(job_id, None)
+            raise RuntimeError(f"Worker pool unavailable ({e.__class__.__name__}); retry later") from e
+        future.add_done_callback(lambda f: self._finish(job_id, f, executor))
+        return job_id
+
+    def _submit_with_restart(self, *args):
+        executor = self.executor
+        if not self.pool_ok():
+            self.restart(executor)
+            executor = self.executor
+        try:
+            return executor.submit(*args), executor
+        except (BrokenProcessPool, RuntimeError):
+            self.broken_executor = executor
+            self.restart(executor)
+            executor = self.executor
+            return executor.submit(*args), executor
+
+    def _finish(self, job_id, future, executor):
+        with self.lock:
+            job = self.jobs[job_id]
+            job['finished'] = time.time()
+            try:
+                job['result'] = future.result()
+                job['status'] = 'done'
+            except Exception as e:
+                job['error'] = str(e) or e.__class__.__name__
+                job['status'] = 'failed'
+                if isinstance(e, BrokenProcessPool):
+                    self.broken_executor = executor
+            # Forget the oldest finished jobs beyond the retention limit
+            self.finished.append(job_id)
+            while len(self.finished) > self.max_finished:
+                self.jobs.pop(self.finished.pop(0), None)
+
+    def status(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            info = {
+                'job_id': job_id,
+                'status': job['status'],
+                'progress': dict(job['progress']),
+                'error': job['error'],
+            }
+            if job['finished']:
+                info['elapsed'] = round(job['finished'] - job['submitted'], 3)
+            if job['result']:
+                info['fitness'] = job['result']['fitness']
+                info['scheduled'] = len(job['result']['timetable'])
+                info['feasibility'] = job['result']['feasibility']
+                info['cache'] = job['result']['cache']
+            return info
+
+    def result(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return job['result'] if job else None
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.progress_queue.put(None)
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    service = None  # set by make_server
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, code, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Stream the timetable back in chunks instead of building one big body
+    def send_csv(self, timetable):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        df = pd.DataFrame(timetable, columns=RESULT_COLUMNS)
+        for start in range(0, max(len(df), 1), CHUNK_ROWS):
+            chunk = df.iloc[start:start + CHUNK_ROWS].to_csv(index=False, header=start == 0)
+            data = chunk.encode('utf-8')
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        query = parse_qs(url.query)
+
+        if parts == ['health']:
+            pool_ok = self.service.pool_ok()
+            with self.service.lock:
+                pending = self.service.pending_count()
+            self.send_json(200 if pool_ok else 503,
+                           {'status': 'ok' if pool_ok else 'broken',
+                            'workers': self.service.workers, 'pending': pending})
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            info = self.service.status(parts[1])
+            if info is None:
+                self.send_json(404, {'error': 'Unknown job'})
+            else:
+                self.send_json(200, info)
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'result':
+            info = self.service.status(parts[1])
+            if info is None:
+                self.send_json(404, {'error': 'Unknown job'})
+            elif info['status'] != 'done':
+                self.send_json(409, info)
+            elif query.get('format', ['csv'])[0] == 'json':
+                self.send_json(200, self.service.result(parts[1]))
+            else:
+                self.send_csv(self.service.result(parts[1])['timetable'])
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/jobs':
+            self.send_json(404, {'error': 'Not found'})
+            return
+        query = parse_qs(url.query)
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            df = parse_course_data(body, self.headers.get('Content-Type', 'text/csv'))
+            generations = int(query.get('generations', ['30'])[0])
+            population_size = int(query.get('population_size', ['20'])[0])
+            if generations < 1 or population_size < 2:
+                raise ValueError("generations must be >= 1 and population_size >= 2")
+        except Exception as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        batched = query.get('batched', ['0'])[0] in ('1', 'true')
+        strict = query.get('strict', ['0'])[0] in ('1', 'true')
+
+        try:
+            job_id = self.service.submit(df, generations, population_size, batched, strict)
+        except RuntimeError as e:
+            self.send_json(503, {'error': str(e)})
+            return
+        if job_id is None:
+            self.send_json(503, {'error': 'Too many pending jobs, retry later'})
+        else:
+            self.send_json(202, {'job_id': job_id, 'status': 'queued'})
+
+
+def make_server(host='127.0.0.1', port=8000, workers=2, max_pending=16):
+    """Build the HTTP server and its SolveService; the caller serves and shuts down"""
+    service = SolveService(workers=workers, max_pending=max_pending)
+    service.warm_up()
+    handler = type('Handler', (SolveRequestHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server, service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local timetable solve service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-pending', type=int, default=16)
+    args = parser.parse_args()
+
+    server, service = make_server(args.host, args.port, args.workers, args.max_pending)
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,11 @@
 import pandas as pd
 
 def load_data(csv_file):
-    df = pd.read_csv(csv_file)
+    # Accepts a path, a file-like object or an already loaded DataFrame
+    if isinstance(csv_file, pd.DataFrame):
+        df = csv_file.copy()
+    else:
+        df = pd.read_csv(csv_file)
     df.columns = df.columns.str.strip()
     return df
 
@@ -16,3 +20,34 @@ def generate_classrooms():
     labs = [f"Lab-{i}" for i in range(1, 6)]
     theory_rooms = [f"Room-{i}" for i in range(101, 111)]
     return labs + theory_rooms
+
+def split_hours(hours):
+    # Split credit hours into theory lecture and lab blocks
+    lectures = []
+    labs = []
+    if hours == 3:
+        # 3 credit hours: 2 theory lectures (1.5 each, rounded to 1-2 hours) + 1 lab (1 hour)
+        lectures = [2, 1]  # 2 lectures: 2 hours and 1 hour
+        labs = [1]  # 1 lab: 1 hour
+    elif hours == 2:
+        # 2 credit hours: 1 theory lecture (2 hours)
+        lectures = [2]
+    elif hours == 1:
+        # 1 credit hour: 1 lecture (1 hour)
+        lectures = [1]
+    else:
+        # For other hours, distribute appropriately
+        while hours > 0:
+            if hours >= 3:
+                lectures.append(2)
+                hours -= 2
+                if hours >= 1:
+                    labs.append(1)
+                    hours -= 1
+            elif hours >= 2:
+                lectures.append(2)
+                hours -= 2
+            else:
+                lectures.append(1)
+                hours -= 1
+    return lectures, labs
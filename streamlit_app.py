@@ -50,6 +50,11 @@ st.markdown('<div class="main-header">INTELLIGENT TIMETABLE GA SYSTEM</div>', un
 if 'df_timetable' not in st.session_state:
     with st.spinner("Generating timetable..."):
         ga = GeneticAlgorithmTimetable(csv_file="timetable_data.csv")
+        report = ga.check_feasibility()
+        for error in report['errors']:
+            st.error(error)
+        for warning in report['warnings']:
+            st.warning(warning)
         timetable, fitness = ga.run(generations=30, population_size=20)
         
         if timetable:
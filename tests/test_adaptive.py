@@ -0,0 +1,68 @@
+from src.adaptive import AdaptiveOperatorControl
+
+
+def test_quality_moves_toward_rewarded_operators():
+    control = AdaptiveOperatorControl()
+    control.record(0, parent_fitness=50, child_fitness=60, crossover_op='uniform', mutation_op='room')
+    control.record(1, parent_fitness=50, child_fitness=40, crossover_op='two_point', mutation_op='day')
+    control.update(0, [70, 30])
+
+    # uniform: child +10 over parents; room: +10 over its child; the others earned nothing
+    assert control.crossover_quality['uniform'] > 1.0
+    assert control.crossover_quality['two_point'] < 1.0
+    assert control.mutation_quality['room'] > 1.0
+    assert control.mutation_quality['day'] < 1.0
+    assert control.crossover_quality['single_point'] == 1.0
+    probs = control.mutation_probabilities()
+    assert probs['room'] == max(probs.values())
+    assert abs(sum(probs.values()) - 1.0) < 1e-9
+
+
+def test_mutation_rate_follows_median_success_rule():
+    control = AdaptiveOperatorControl(mutation_rate=0.3)
+    control.update(0, [10, 20, 30])  # sets previous_median to 20
+    assert control.mutation_rate == 0.3  # nothing bred yet
+
+    for i in range(3):
+        control.record(i, 0, 0, 'uniform', 'day')
+    control.update(1, [25, 25, 10])  # 2 of 3 beat the median
+    assert control.mutation_rate > 0.3
+
+    rate = control.mutation_rate
+    for i in range(3):
+        control.record(i, 0, 0, 'uniform', 'day')
+    control.update(2, [30, 10, 10])  # 1 of 3 beats the median of 25
+    assert control.mutation_rate < rate
+
+
+def test_mutation_rate_stays_within_bounds():
+    control = AdaptiveOperatorControl(mutation_rate=0.1, min_mutation_rate=0.05, max_mutation_rate=0.2)
+    for gen in range(30):
+        control.record(0, 0, 0, 'uniform', 'day')
+        control.update(gen, [gen + 100, 0])  # always beats the previous median
+        assert 0.05 <= control.mutation_rate <= 0.2
+    assert control.mutation_rate == 0.2
+
+    for gen in range(30):
+        control.record(0, 0, 0, 'uniform', 'day')
+        control.update(gen, [0, 100])  # never beats it
+        assert 0.05 <= control.mutation_rate <= 0.2
+    assert control.mutation_rate == 0.05
+
+
+def test_max_mutations_anneals_with_spread():
+    control = AdaptiveOperatorControl(max_mutations=3)
+    control.update(0, [0, 100])
+    assert control.max_mutations == 3
+    control.update(1, [80, 80, 80])
+    assert control.max_mutations == 1
+
+
+def test_history_gets_one_entry_per_update():
+    control = AdaptiveOperatorControl()
+    for gen in range(4):
+        control.record(0, 0, 0, 'single_point', 'swap')
+        control.update(gen, [1, 2])
+    assert [h['generation'] for h in control.history] == [0, 1, 2, 3]
+    assert all(h['offspring'] == 1 for h in control.history)
+    assert control.pending == []
@@ -0,0 +1,45 @@
+import os
+import random
+from collections import Counter
+
+import numpy as np
+
+from src.batch_operators import PopulationEncoding, LAST_HOUR
+from src.ga_timetable import GeneticAlgorithmTimetable
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'timetable_data.csv')
+
+
+def encoded_population(size=50):
+    random.seed(0)
+    ga = GeneticAlgorithmTimetable(csv_file=DATA)
+    encoding = PopulationEncoding(ga.df, ga.classrooms)
+    return encoding, encoding.encode([ga.create_individual() for _ in range(size)])
+
+
+def test_swap_only_mutation_preserves_slot_multiset():
+    encoding, (days, starts, rooms) = encoded_population()
+    new_days, new_starts, new_rooms, applied = encoding.mutate(
+        days, starts, rooms, np.random.default_rng(0),
+        mutation_rate=1.0, max_mutations=3, weights=[0, 0, 0, 1])
+
+    assert applied[:, 3].all()
+    assert (new_rooms == rooms).all()
+    for row in range(days.shape[0]):
+        assert not (new_days[row] == days[row]).all()
+        for duration in np.unique(encoding.durations):
+            genes = encoding.durations == duration
+            before = Counter(zip(days[row, genes], starts[row, genes]))
+            after = Counter(zip(new_days[row, genes], new_starts[row, genes]))
+            assert before == after
+
+
+def test_mutation_keeps_room_types_and_teaching_day():
+    encoding, (days, starts, rooms) = encoded_population()
+    new_days, new_starts, new_rooms, _ = encoding.mutate(
+        days, starts, rooms, np.random.default_rng(1), mutation_rate=1.0)
+
+    placed = new_days >= 0
+    room_is_lab = np.array(['Lab' in r for r in encoding.classrooms])[new_rooms]
+    assert (room_is_lab == encoding.is_lab)[placed].all()
+    assert (new_starts + encoding.durations <= LAST_HOUR)[placed].all()
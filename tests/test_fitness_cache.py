@@ -0,0 +1,63 @@
+import os
+import random
+
+from src.fitness_cache import FitnessCache, timetable_key
+from src.ga_timetable import GeneticAlgorithmTimetable
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'timetable_data.csv')
+
+
+def test_lru_evicts_least_recently_used():
+    cache = FitnessCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now the oldest
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size'] == 2
+
+
+def test_rescored_elite_is_a_hit():
+    random.seed(0)
+    ga = GeneticAlgorithmTimetable(csv_file=DATA)
+    elite = ga.create_individual()
+
+    first = ga.calculate_fitness(elite)
+    again = ga.calculate_fitness([entry.copy() for entry in elite])
+
+    assert first == again
+    assert (ga.fitness_cache.hits, ga.fitness_cache.misses) == (1, 1)
+    assert timetable_key(elite) in ga.fitness_cache.entries
+
+
+def run_keys(replace_duplicates):
+    ga = GeneticAlgorithmTimetable(csv_file=DATA)
+    ga.df = ga.df.head(3).copy()
+    # Without mutation, crossovers of the same six parents keep repeating timetables
+    ga.mutate = lambda timetable, **kwargs: timetable
+    generations = [[]]
+    scored = ga.calculate_fitness
+
+    # Without adaptive control every fitness call between progress callbacks scores one generation
+    def record(timetable):
+        generations[-1].append(timetable_key(timetable))
+        return scored(timetable)
+
+    ga.calculate_fitness = record
+    random.seed(0)
+    ga.run(generations=15, population_size=20, adaptive=False, replace_duplicates=replace_duplicates,
+           progress=lambda *args: generations.append([]))
+    return [keys for keys in generations[1:] if keys]
+
+
+def test_replace_duplicates_keeps_generations_unique():
+    assert any(len(keys) != len(set(keys)) for keys in run_keys(replace_duplicates=False))
+
+    bred = run_keys(replace_duplicates=True)
+    assert bred
+    for keys in bred:
+        assert len(keys) == len(set(keys))
@@ -0,0 +1,57 @@
+import os
+import random
+import warnings
+
+from src.ga_timetable import GeneticAlgorithmTimetable
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'timetable_data.csv')
+
+
+def make_ga(rows=3, **overrides):
+    ga = GeneticAlgorithmTimetable(csv_file=DATA)
+    ga.df = ga.df.head(rows).copy()
+    for column, value in overrides.items():
+        ga.df[column] = value
+    return ga
+
+
+def test_more_blocks_than_days_places_what_fits():
+    random.seed(0)
+    ga = make_ga()
+    ga.df.loc[0, 'Hours'] = 9  # 6 blocks, 5 days
+    subject = ga.df.loc[0, 'Subject']
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        report = ga.check_feasibility()
+        timetable, _ = ga.run(generations=3, population_size=4)
+
+    assert not report['feasible']
+    assert report['min_unscheduled_blocks'] == 1
+    individual = ga.create_individual()
+    placed = [e for e in individual if e['Subject'] == subject]
+    assert len(placed) <= 5
+    assert timetable
+    # The reported unavoidable penalty caps the score the GA can reach
+    max_score = (1000 - report['penalty_lower_bound']) / 10
+    assert ga.calculate_fitness(individual) <= max_score
+    assert ga.calculate_fitness(timetable) <= max_score
+
+
+def test_fitness_counts_expected_blocks_not_rows():
+    random.seed(0)
+    ga = make_ga()
+    ga.expected_blocks = ga.count_expected_blocks()
+    full = ga.create_individual()
+
+    assert ga.expected_blocks > len(ga.df)
+    assert len(full) == ga.expected_blocks
+    assert ga.calculate_fitness(full[:-1]) <= 95.0
+
+
+def test_run_without_schedulable_rows_returns_nothing():
+    ga = make_ga(Hours=0)
+
+    assert ga.run(generations=3, population_size=4) == (None, 0)
+    assert ga.run(generations=3, population_size=4, replace_duplicates=True) == (None, 0)
+    assert ga.run_batched(generations=3, population_size=4) == (None, 0)
@@ -0,0 +1,147 @@
+import json
+import os
+import signal
+import threading
+import time
+import urllib.request
+from concurrent.futures.process import BrokenProcessPool
+from urllib.error import HTTPError
+
+import pandas as pd
+
+from src.service import make_server
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'timetable_data.csv')
+
+
+def request(url, data=None):
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'text/csv'})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, json.loads(resp.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_dead_worker_is_reported_and_replaced():
+    server, service = make_server(port=0, workers=1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    with open(DATA, 'rb') as f:
+        csv_data = f.read()
+    try:
+        assert request(f"{url}/health")[0] == 200
+        for pid in service.warm_up():
+            os.kill(pid, signal.SIGKILL)
+        deadline = time.time() + 10
+        while service.pool_ok() and time.time() < deadline:
+            time.sleep(0.05)
+
+        code, body = request(f"{url}/health")
+        assert (code, body['status']) == (503, 'broken')
+
+        # The service already knows, so the next job goes to a rebuilt pool
+        code, body = request(f"{url}/jobs?generations=2", csv_data)
+        assert code == 202
+        job_id = body['job_id']
+        while request(f"{url}/jobs/{job_id}")[1]['status'] in ('queued', 'running'):
+            time.sleep(0.05)
+        assert request(f"{url}/jobs/{job_id}")[1]['status'] == 'done'
+        assert request(f"{url}/health")[0] == 200
+        assert service.pending_count() == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+
+def test_concurrent_restarts_rebuild_once():
+    server, service = make_server(port=0, workers=1)
+    try:
+        failed = service.executor
+        built = []
+        make_executor = service._make_executor
+        service._make_executor = lambda: built.append(1) or make_executor()
+        threads = [threading.Thread(target=service.restart, args=(failed,)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        rebuilt = service.executor
+        assert rebuilt is not failed
+        assert len(built) == 1
+
+        # A late restart for the old pool must not replace the new one
+        service.restart(failed)
+        assert service.executor is rebuilt
+        assert len(built) == 1
+        assert service.warm_up()
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def test_health_checks_add_no_work():
+    server, service = make_server(port=0, workers=1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    submitted = []
+    submit = service.executor.submit
+    service.executor.submit = lambda *args, **kwargs: submitted.append(args) or submit(*args, **kwargs)
+    try:
+        for _ in range(50):
+            assert request(f"{url}/health")[0] == 200
+        assert submitted == []
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+
+def test_worker_killed_mid_job_fails_only_that_job():
+    server, service = make_server(port=0, workers=1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    with open(DATA, 'rb') as f:
+        csv_data = f.read()
+    try:
+        pids = service.warm_up()
+        code, body = request(f"{url}/jobs?generations=500", csv_data)
+        assert code == 202
+        job_id = body['job_id']
+        while request(f"{url}/jobs/{job_id}")[1]['status'] != 'running':
+            time.sleep(0.05)
+        for pid in pids:
+            os.kill(pid, signal.SIGKILL)
+        while request(f"{url}/jobs/{job_id}")[1]['status'] == 'running':
+            time.sleep(0.05)
+        assert request(f"{url}/jobs/{job_id}")[1]['status'] == 'failed'
+        assert request(f"{url}/health")[0] == 503
+
+        code, body = request(f"{url}/jobs?generations=2", csv_data)
+        assert code == 202
+        assert request(f"{url}/health")[0] == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+
+def test_submit_retries_once_on_a_pool_that_breaks_during_submit():
+    server, service = make_server(port=0, workers=1)
+    try:
+        def broken(*args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+        failed = service.executor
+        failed.submit = broken
+        job_id = service.submit(pd.read_csv(DATA).head(3), generations=1, population_size=2)
+
+        assert job_id is not None
+        assert service.executor is not failed
+        while service.status(job_id)['status'] in ('queued', 'running'):
+            time.sleep(0.05)
+        assert service.status(job_id)['status'] == 'done'
+    finally:
+        server.server_close()
+        service.shutdown()